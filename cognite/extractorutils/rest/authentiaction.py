@@ -1,7 +1,9 @@
 import logging
+import threading
+import time
 from base64 import b64encode
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from cognite.extractorutils.authentication import Authenticator, AuthenticatorConfig
 from cognite.extractorutils.exceptions import InvalidConfigError
@@ -19,11 +21,6 @@ class AuthConfig:
     oauth: Optional[AuthenticatorConfig]
 
 
-def _number_of_not_nones(*args: Any) -> int:
-    none_checks = [i is not None for i in args]
-    return sum(none_checks)
-
-
 class AuthenticationProvider:
     """
     A general provider of auth headers. Given the AuthConfig provided, it will give an appropriate header value for
@@ -48,12 +45,24 @@ class AuthenticationProvider:
     def __init__(self, config: Optional[AuthConfig]):
         self.config = config
         self.authenticator: Optional[Authenticator] = None
-        self.logger = logging.getLogger()
+        self.logger = logging.getLogger(__name__)
+
+        self._basic_header: Optional[str] = None
+        self._bearer_header: Optional[str] = None
+        self._bearer_expiry: float = 0.0
+        self._bearer_lock = threading.Lock()
 
         if self.config is not None:
-            if _number_of_not_nones(self.config.oauth, self.config.basic) != 1:
+            if (self.config.oauth is not None) + (self.config.basic is not None) != 1:
                 raise InvalidConfigError(f"One of {AuthConfig.__dataclass_fields__.keys()} is required for auth")
 
+            if self.config.basic:
+                # Credentials don't change after config is loaded, so the header can be made once
+                token = b64encode(
+                    f"{self.config.basic.username or ''}:{self.config.basic.password or ''}".encode("utf8")
+                )
+                self._basic_header = f"Basic {token.decode('utf8')}"
+
             if self.config.oauth:
                 self.authenticator = Authenticator(self.config.oauth)
 
@@ -82,16 +91,33 @@ class AuthenticationProvider:
         if self.config is None:
             raise InvalidConfigError("No auth configured")
 
-        if self.config.basic:
-            self.logger.info("Using basic auth")
-            token = b64encode(f"{self.config.basic.username or ''}:{self.config.basic.password or ''}".encode("utf8"))
-            return f"Basic {token.decode('utf8')}"
+        if self._basic_header is not None:
+            self.logger.debug("Using basic auth")
+            return self._basic_header
 
         if self.config.oauth:
             if not self.authenticator:
                 # Will never happen, but to appease mypy
                 raise ValueError("Illegal stage: no authenticator when oauth2 is configured")
-            self.logger.info("Using OAuth2")
-            return f"Bearer {self.authenticator.get_token()}"
+            self.logger.debug("Using OAuth2")
+            return self._get_bearer_header(self.authenticator, self.config.oauth)
 
         raise RuntimeError("Unexpected error: no auth config defined")
+
+    def _get_bearer_header(self, authenticator: Authenticator, config: AuthenticatorConfig) -> str:
+        """
+        Get a bearer auth header, reusing the previous one until the token is about to expire.
+
+        The authenticator does not expose the token lifetime, so this reads it from the authenticator's private
+        ``_response`` attribute, an internal detail of extractor-utils. If that is missing, the header is not cached,
+        and the authenticator (which caches the token itself) is asked for the token on every call.
+        """
+        with self._bearer_lock:
+            if self._bearer_header is None or time.monotonic() >= self._bearer_expiry:
+                self._bearer_header = f"Bearer {authenticator.get_token()}"
+
+                response: Optional[Dict[str, Any]] = getattr(authenticator, "_response", None)
+                expires_in = response.get("expires_in", 0) if isinstance(response, dict) else 0
+                self._bearer_expiry = time.monotonic() + expires_in - config.min_ttl
+
+            return self._bearer_header
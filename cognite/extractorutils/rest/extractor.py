@@ -11,27 +11,50 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import json
+import heapq
+import inspect
+import logging
+import random
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
-from queue import Empty, PriorityQueue
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 from urllib.parse import urljoin
 
 import dacite
-import requests
+import orjson
 from cognite.extractorutils.configtools import StateStoreConfig
 from cognite.extractorutils.exceptions import InvalidConfigError
-from cognite.extractorutils.retry import retry
 from cognite.extractorutils.uploader_extractor import UploaderExtractor, UploaderExtractorConfig
-from cognite.extractorutils.uploader_types import CdfTypes
+from cognite.extractorutils.uploader_types import CdfTypes, Event, InsertDatapoints, RawRow
 from dacite import DaciteError
-from requests import Response
-from requests.exceptions import HTTPError, JSONDecodeError
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional dependency, only needed for msgspec.Struct response types
+    msgspec = None  # type: ignore
 
 from cognite.extractorutils.rest.authentiaction import AuthConfig, AuthenticationProvider
 from cognite.extractorutils.rest.http import (
@@ -51,7 +74,8 @@ class RetryConfig:
     max_delay: float = 60
     delay: float = 5
     number: int = 5
-    jitter: float = 1
+    # Deprecated and ignored, retries are fully jittered between 0 and the backoff delay
+    jitter: Optional[float] = None
 
 
 @dataclass
@@ -85,12 +109,29 @@ class HttpCall:
         url: The url it will query
         call_when: Some timestamp in seconds since epoch when this should be called. Can be 0 to indicate
             that it should be called as soon as possible.
+        previous: The previous page of the same endpoint, if this page was fetched before it was handled.
     """
 
+    __slots__ = ("endpoint", "url", "call_when", "previous")
+
     endpoint: Endpoint
     url: HttpUrl
     # When this endpoint should next be called
     call_when: float
+    previous: Optional["_PageHandling"]
+
+
+class _PageHandling:
+    """
+    Tracks the handling of a page, so that a page fetched ahead of time is only handled after the one before it, and
+    not at all if that one failed.
+    """
+
+    __slots__ = ("done", "failed")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.failed = False
 
 
 @dataclass(order=True)
@@ -152,9 +193,13 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         # This is set to None when the extractor is running,
         # and new endpoints should be added to the call_queue instead.
         self._initial_endpoints: Optional[List[Endpoint]] = []
-        self._call_queue: PriorityQueue[PrioritizedHttpCall] = PriorityQueue()
+        # Heap of scheduled calls. The condition guards both the heap and n_executing, and is notified when either
+        # changes, so the producer wakes up as soon as there is something to do.
+        self._call_queue: List[PrioritizedHttpCall] = []
+        self._call_condition = threading.Condition()
         self.n_executing = 0
         self._min_check_interval = 1
+        self._session: Optional[Session] = None
 
     def _add_endpoint(self, endpoint: Endpoint) -> None:
         """
@@ -164,8 +209,48 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         if self._initial_endpoints is not None:
             self._initial_endpoints.append(endpoint)
         else:
-            call = HttpCall(endpoint=endpoint, url=_get_initial_url(self.base_url, endpoint), call_when=0)
-            self._call_queue.put(PrioritizedHttpCall(priority=call.call_when, call=call))
+            self._prepare_endpoint(endpoint)
+            self._schedule_call(
+                HttpCall(endpoint=endpoint, url=_get_initial_url(self.base_url, endpoint), call_when=0, previous=None)
+            )
+
+    def _schedule_call(self, call: HttpCall) -> None:
+        with self._call_condition:
+            heapq.heappush(self._call_queue, PrioritizedHttpCall(priority=call.call_when, call=call))
+            self._call_condition.notify()
+
+    def _prepare_endpoint(self, endpoint: Endpoint) -> None:
+        """
+        Precompute the parts of the requests to an endpoint that does not change between calls. Requires the config to
+        be loaded.
+        """
+        if not callable(endpoint.path):
+            endpoint._url = urljoin(self.base_url, endpoint.path)
+
+        headers: Dict[str, Union[str, Callable[[], str]]] = {**self.headers, **endpoint.headers}
+        if self.config.source.headers:
+            headers.update(self.config.source.headers)
+        if endpoint.body is not None:
+            headers["Content-Type"] = "application/json"
+
+        endpoint._static_headers = {k: v for k, v in headers.items() if not callable(v)}
+        endpoint._dynamic_headers = {k: v for k, v in headers.items() if callable(v)}
+
+        endpoint._static_query = {k: str(v) for k, v in endpoint.query.items() if not callable(v)}
+        endpoint._dynamic_query = {k: v for k, v in endpoint.query.items() if callable(v)}
+
+        endpoint._parse_response = _get_response_parser(endpoint.response_type)
+        endpoint._handle_output = self._get_output_handler(endpoint.implementation)
+
+        # Bodies without any callables serialize to the same JSON every time
+        endpoint._body_is_static = not _body_has_callable(endpoint.body)
+        if endpoint._body_is_static:
+            endpoint._serialized_body = _format_body(endpoint.body)
+
+        # Periodic GETs of the same URL can be revalidated with ETag/Last-Modified, so unchanged data is not reprocessed
+        endpoint._revalidate = (
+            endpoint.method == HttpMethod.GET and endpoint.interval is not None and endpoint.next_page is None
+        )
 
     def add_endpoint(
         self,
@@ -180,6 +265,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]] = None,
         interval: Optional[int] = None,
+        prefetch: bool = False,
     ) -> None:
         """
         Add an endpoint to the list of active endpoints. Use this to create new endpoint
@@ -197,6 +283,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
                 response_type=response_type,
                 next_page=next_page,
                 interval=interval,
+                prefetch=prefetch,
             )
         )
 
@@ -212,6 +299,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]],
         interval: Optional[int],
+        prefetch: bool = False,
     ) -> Callable[[Callable[[ResponseType], CdfTypes]], Callable[[ResponseType], CdfTypes]]:
         """
         A generic endpoint decorator. Not meant to be used directly, use ``get`` or ``post`` instead.
@@ -230,6 +318,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
                     response_type=response_type,
                     next_page=next_page,
                     interval=interval,
+                    prefetch=prefetch,
                 )
             )
             return func
@@ -248,6 +337,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]],
         interval: Optional[int],
+        prefetch: bool = False,
     ) -> Callable[[Callable[[ResponseType], CdfTypes]], Callable[[ResponseType], CdfTypes]]:
         """
         A generic endpoint decorator. Not meant to be used directly, use ``get`` or ``post`` instead.
@@ -267,6 +357,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
                         response_type=response_type,
                         next_page=next_page,
                         interval=interval,
+                        prefetch=prefetch,
                     )
                 )
             return func
@@ -283,6 +374,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]] = None,
         interval: Optional[int] = None,
+        prefetch: bool = False,
     ) -> Callable[[Callable[[ResponseType], CdfTypes]], Callable[[ResponseType], CdfTypes]]:
         """
         Perform a GET request and give the result to the decorated function. The output of the decorated function will
@@ -294,9 +386,17 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             query: Query parameters. Values can either be values or callables giving values.
             headers: Headers. Values can either be values or callables giving values.
             response_type: Class to deserialize response JSON into
-            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to.
+            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to. It is
+                called after the decorated function has handled the response, and no more pages are requested if the
+                decorated function fails.
             interval: A target iteration time. If given, the extractor will make periodic requests instead of a single
-                request.
+                request. With ``next_page``, each request is made to the URL returned from the previous one, otherwise
+                the same request is repeated, and revalidated with ``If-None-Match`` or ``If-Modified-Since`` if the
+                source sent an ``ETag`` or ``Last-Modified`` header. Unmodified responses are not handled again.
+            prefetch: Call ``next_page`` before the decorated function instead of after, so that the next page is
+                fetched while the current one is handled. Pages are still handled in order, and pages after a failed
+                one are not handled. Only use this if ``next_page`` does not depend on state set by the decorated
+                function. Has no effect together with ``interval``.
         """
         return self.endpoint(
             name=name,
@@ -308,6 +408,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             response_type=response_type,
             next_page=next_page,
             interval=interval,
+            prefetch=prefetch,
         )
 
     def post(
@@ -321,6 +422,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]] = None,
         interval: Optional[int] = None,
+        prefetch: bool = False,
     ) -> Callable[[Callable[[ResponseType], CdfTypes]], Callable[[ResponseType], CdfTypes]]:
         """
         Perform a POST request and give the result to the decorated function. The output of the decorated function will
@@ -332,11 +434,19 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             query: Query parameters. Values can either be values or callables giving values.
             headers: Headers. Values can either be values or callables giving values.
             body: Request body represented as a dictionary. Will be serialized into JSON. Values can either be values
-                or callables giving values.
+                or callables giving values. A body without any callables is serialized once, when the endpoint is
+                scheduled.
             response_type: Class to deserialize response JSON into
-            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to.
+            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to. It is
+                called after the decorated function has handled the response, and no more pages are requested if the
+                decorated function fails.
             interval: A target iteration time. If given, the extractor will make periodic requests instead of a single
-                request.
+                request. With ``next_page``, each request is made to the URL returned from the previous one, otherwise
+                the same request is repeated.
+            prefetch: Call ``next_page`` before the decorated function instead of after, so that the next page is
+                fetched while the current one is handled. Pages are still handled in order, and pages after a failed
+                one are not handled. Only use this if ``next_page`` does not depend on state set by the decorated
+                function. Has no effect together with ``interval``.
         """
         return self.endpoint(
             name=name,
@@ -348,6 +458,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             response_type=response_type,
             next_page=next_page,
             interval=interval,
+            prefetch=prefetch,
         )
 
     def get_multiple(
@@ -360,6 +471,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         response_type: Type[ResponseType],
         next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]] = None,
         interval: Optional[int] = None,
+        prefetch: bool = False,
     ) -> Callable[[Callable[[ResponseType], CdfTypes]], Callable[[ResponseType], CdfTypes]]:
         """
         Perform a GET request and give the result to the decorated function. The output of the decorated function will
@@ -371,9 +483,16 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             query: Query parameters. Values can either be values or callables giving values.
             headers: Headers. Values can either be values or callables giving values.
             response_type: Class to deserialize response JSON into
-            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to.
+            next_page: A callable taking an HttpCallResult and returning the next HttpUrl to make a request to. It is
+                called after the decorated function has handled the response, and no more pages are requested if the
+                decorated function fails.
             interval: A target iteration time. If given, the extractor will make periodic requests instead of a single
-                request.
+                request. With ``next_page``, each request is made to the URL returned from the previous one, otherwise
+                the same request is repeated.
+            prefetch: Call ``next_page`` before the decorated function instead of after, so that the next page is
+                fetched while the current one is handled. Pages are still handled in order, and pages after a failed
+                one are not handled. Only use this if ``next_page`` does not depend on state set by the decorated
+                function. Has no effect together with ``interval``.
         """
         return self.endpoint_list(
             name=name,
@@ -385,6 +504,7 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
             response_type=response_type,
             next_page=next_page,
             interval=interval,
+            prefetch=prefetch,
         )
 
     def __enter__(self) -> "RestExtractor":
@@ -402,12 +522,31 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         if self.config.extractor.request_parallelism <= 0:
             raise InvalidConfigError("request-parallelism must be a number greater than 0")
 
+        if self.config.source.retries.jitter is not None:
+            self.logger.warning(
+                "source.retries.jitter is deprecated and has no effect, retries are fully jittered between 0 and the "
+                "backoff delay"
+            )
+
+        # Share one session across all calls so connections to the source are kept alive and reused. The pool must be
+        # at least as large as the number of parallel requests, or connections will be discarded after use.
+        self._session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.extractor.request_parallelism,
+            pool_maxsize=self.config.extractor.request_parallelism,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         return self
 
     def __exit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
     ) -> bool:
         self._initial_endpoints = []
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         return super(RestExtractor, self).__exit__(exc_type, exc_val, exc_tb)
 
     def prepare_headers(self, endpoint: Endpoint) -> Dict[str, str]:
@@ -426,48 +565,75 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         Returns:
             A dictionary of header keys/values
         """
-        headers: Dict[str, str] = {k: _get_or_call(v) for k, v in self.headers.items()}
-
-        for k, v in endpoint.headers.items():
-            headers[k] = _get_or_call(v)
+        # Static headers are merged in priority order when the endpoint is scheduled, only callables need evaluation
+        headers = endpoint._static_headers.copy()
 
-        if self.config.source.headers:
-            for k2, v2 in self.config.source.headers.items():
-                headers[k2] = v2
+        for k, v in endpoint._dynamic_headers.items():
+            headers[k] = v()
 
         if self.authentication.is_configured:
             headers["Authorization"] = self.authentication.auth_header
 
-        if endpoint.body is not None:
-            headers["Content-Type"] = "application/json"
-
         return headers
 
+    def _get_output_handler(self, implementation: Callable[[ResponseType], CdfTypes]) -> Callable[[Any], None]:
+        """
+        Find the upload queue handler for the output of an implementation based on its return type annotation. Falls
+        back to the generic ``handle_output``, which inspects the output itself, if the annotation is missing or
+        ambiguous.
+        """
+        output_type = _get_output_type(implementation)
+
+        if output_type is Event:
+            return self._handle_events
+        elif output_type is RawRow:
+            return self._handle_raw_rows
+        elif output_type is InsertDatapoints:
+            return self._handle_datapoints
+        else:
+            return self.handle_output
+
+    def _handle_events(self, output: Union[Event, Iterable[Event]]) -> None:
+        add_to_upload_queue = self.event_queue.add_to_upload_queue
+        apply_middleware = self._apply_middleware
+        for event in [output] if isinstance(output, Event) else output:  # type: ignore
+            add_to_upload_queue(apply_middleware(event))
+
+    def _handle_raw_rows(self, output: Union[RawRow, Iterable[RawRow]]) -> None:
+        add_to_upload_queue = self.raw_queue.add_to_upload_queue
+        apply_middleware = self._apply_middleware
+        for raw_row in [output] if isinstance(output, RawRow) else output:
+            database, table = raw_row.db_name, raw_row.table_name
+            for row in raw_row.rows:  # type: ignore
+                add_to_upload_queue(database=database, table=table, raw_row=apply_middleware(row))
+
+    def _handle_datapoints(self, output: Union[InsertDatapoints, Iterable[InsertDatapoints]]) -> None:
+        add_to_upload_queue = self.time_series_queue.add_to_upload_queue
+        for datapoints in [output] if isinstance(output, InsertDatapoints) else output:
+            add_to_upload_queue(
+                id=datapoints.id, external_id=datapoints.external_id, datapoints=datapoints.datapoints  # type: ignore
+            )
+
     def _get_next_call(self) -> Optional[HttpCall]:
-        waiting: Optional[PrioritizedHttpCall] = None
-        while not self.cancellation_token.is_set():
-            # If n_executing is set to 0, and the queue is empty here, then we are done
-            # This is race condition prone in theory, but it should work. n_executing is
-            # only decremented after giving the call a chance to add to the call queue, so
-            # either the call is unfinished, and n_executing is > 0, or the queue length is
-            # accurate.
-            if self.n_executing == 0 and self._call_queue.empty():
-                return waiting.call if waiting is not None else None
-            to_wait = self._min_check_interval if waiting is None else waiting.call.call_when - time.time()
-            if waiting is not None and to_wait <= 0:
-                return waiting.call
-            try:
-                next: PrioritizedHttpCall = self._call_queue.get(block=True, timeout=to_wait)
-            except Empty:
-                continue
-
-            if waiting is not None and next.call.call_when < waiting.call.call_when:
-                self._call_queue.put(waiting)
-                waiting = next
-            elif waiting is None:
-                waiting = next
-            else:
-                self.cancellation_token.wait(min(self._min_check_interval, waiting.call.call_when - time.time()))
+        """
+        Wait for the next scheduled call to be due, and mark it as executing. Returns None when there are no scheduled
+        or executing calls left, or if the extractor is cancelled.
+        """
+        with self._call_condition:
+            while not self.cancellation_token.is_set():
+                if self._call_queue:
+                    to_wait = self._call_queue[0].priority - time.time()
+                    if to_wait <= 0:
+                        self.n_executing += 1
+                        return heapq.heappop(self._call_queue).call
+                elif self.n_executing == 0:
+                    # Nothing is scheduled, and nothing executing can schedule anything more
+                    return None
+                else:
+                    to_wait = self._min_check_interval
+
+                # Wake up regularly to check the cancellation token
+                self._call_condition.wait(min(to_wait, self._min_check_interval))
 
         return None
 
@@ -481,38 +647,44 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
         if not self.started:
             raise ValueError("You must run the extractor in a context manager")
 
-        lock = threading.Lock()
-
         errors: List[Tuple[Exception, HttpCall]] = []
+        # Errors from periodic endpoints are only reported if their last call failed
+        interval_errors: Dict[int, Tuple[Exception, HttpCall]] = {}
 
         def executor_call(endpoint: HttpCall) -> None:
             try:
-                resp = self._call(endpoint)
-                self._handle_call_response(endpoint.endpoint, resp)
+                self._call(endpoint)
+                with self._call_condition:
+                    # The next call is already scheduled, and might have failed by now. Only clear older errors.
+                    last_error = interval_errors.get(id(endpoint.endpoint))
+                    if last_error is not None and last_error[1].call_when <= endpoint.call_when:
+                        del interval_errors[id(endpoint.endpoint)]
             except Exception as e:
-                self.logger.exception("Error in endpoint {}", endpoint.endpoint.name)
-                errors.append((e, endpoint))
-            with lock:
+                self.logger.exception("Error in endpoint %s", endpoint.endpoint.name)
+                if endpoint.endpoint.interval is None:
+                    errors.append((e, endpoint))
+                else:
+                    with self._call_condition:
+                        interval_errors[id(endpoint.endpoint)] = (e, endpoint)
+                    self._retry_after_interval(endpoint)
+            with self._call_condition:
                 self.n_executing -= 1
+                self._call_condition.notify()
 
-        with ThreadPoolExecutor(max_workers=self.config.extractor.request_parallelism) as executor:
-
-            def producer_loop() -> None:
-                try:
-                    while not self.cancellation_token.is_set():
-                        next = self._get_next_call()
-                        if next is None:
-                            break
-                        with lock:
-                            self.n_executing += 1
-                        executor.submit(executor_call, next)
-                except Exception as e:
-                    self.logger.error(f"Failure in call producer thread: {str(e)}")
-
-            producer_thread = threading.Thread(name="Producer", target=producer_loop)
-            producer_thread.start()
-            producer_thread.join()
+        with ThreadPoolExecutor(
+            max_workers=self.config.extractor.request_parallelism, thread_name_prefix="EndpointCall"
+        ) as executor:
+            # The calling thread feeds the executor, as it would only be waiting for the calls to finish anyway
+            try:
+                while not self.cancellation_token.is_set():
+                    next = self._get_next_call()
+                    if next is None:
+                        break
+                    executor.submit(executor_call, next)
+            except Exception as e:
+                self.logger.error(f"Failure in call producer: {str(e)}")
 
+        errors.extend(interval_errors.values())
         if errors:
             # Raise exception to finish uncleanly, and report a failed run
             raise RuntimeError(
@@ -521,94 +693,298 @@ class RestExtractor(UploaderExtractor[CustomRestConfig]):
                 )
             )
 
-    def _call(self, endpoint: HttpCall) -> HttpCallResult:
-        self.logger.info(f"{endpoint.endpoint.method.value} {endpoint.url}")
-        endpoint.url.add_to_query(endpoint.endpoint.query)
-
-        @retry(
-            cancellation_token=self.cancellation_token,
-            exceptions=(HTTPError),
-            max_delay=self.config.source.retries.max_delay,
-            backoff=self.config.source.retries.backoff_factor,
-            jitter=(0, self.config.source.retries.jitter),
-            tries=self.config.source.retries.number,
-            delay=self.config.source.retries.delay,
-        )
-        def inner_call() -> Response:
-            resp = requests.request(
-                method=endpoint.endpoint.method.value,
-                url=str(endpoint.url),
-                data=_format_body(endpoint.endpoint.body),
-                headers=self.prepare_headers(endpoint.endpoint),
-            )
-            status = HTTPStatus(resp.status_code)
-            self.logger.debug(f"Response {resp.status_code}: {status.name} {status.description} - {resp.reason}")
-            resp.raise_for_status()
-            return resp
+    def _call(self, endpoint: HttpCall) -> None:
+        endpoint.url.add_to_query(endpoint.endpoint._static_query)
+        if endpoint.endpoint._dynamic_query:
+            endpoint.url.add_to_query({k: v() for k, v in endpoint.endpoint._dynamic_query.items()})
+        # The query is final from here on, so the URL only needs to be rendered once
+        url = str(endpoint.url)
+        self.logger.debug("%s %s", endpoint.endpoint.method.value, url)
+
+        raw_response = self._request_with_retries(endpoint, url)
+
+        cached = endpoint.endpoint._cached_response
+        if raw_response.status_code == HTTPStatus.NOT_MODIFIED and cached is not None and cached[0] == url:
+            self.logger.debug("%s not modified since last call", url)
+            self._handle_call_response(endpoint.endpoint, HttpCallResult(url=endpoint.url, response=cached[2]))
+            return
+
+        has_content = raw_response.status_code != HTTPStatus.NO_CONTENT or endpoint.endpoint.response_type == Response
+        if not has_content:
+            response: Any = {}
+        else:
+            try:
+                response = endpoint.endpoint._parse_response(raw_response)
+            except _PARSE_ERRORS as e:
+                self.logger.error(f"Error while parsing response: {str(e)}")
+                raise e
+        result = HttpCallResult(url=endpoint.url, response=response)
+
+        if endpoint.endpoint.prefetch and endpoint.endpoint.interval is None:
+            self._handle_prefetched(endpoint, result, has_content)
+            return
 
-        raw_response: Response = inner_call()
+        if has_content:
+            endpoint.endpoint._handle_output(endpoint.endpoint.implementation(response))
+        if endpoint.endpoint._revalidate:
+            validators = _get_validators(raw_response)
+            endpoint.endpoint._cached_response = (url, validators, response) if validators else None
+        self._handle_call_response(endpoint.endpoint, result)
 
+    def _handle_prefetched(self, endpoint: HttpCall, result: HttpCallResult, has_content: bool) -> None:
+        """
+        Schedule the next page before handling this one, so that it is fetched while this one is being handled. Pages
+        are still handled in order, and pages after a failed one are dropped.
+        """
+        handling = _PageHandling()
         try:
-            if endpoint.endpoint.response_type == Response:
-                response = raw_response
-            else:
-                if raw_response.status_code == HTTPStatus.NO_CONTENT:
-                    return HttpCallResult(url=endpoint.url, response={})
-                elif endpoint.endpoint.response_type == JsonBody:
-                    response = raw_response.json()
-                else:
-                    data = raw_response.json()
-                    if isinstance(data, list):
-                        data = {"items": data}
-                    response = dacite.from_dict(endpoint.endpoint.response_type, data)
+            if endpoint.previous is not None:
+                endpoint.previous.done.wait()
+                if endpoint.previous.failed:
+                    self.logger.debug("Dropping %s, since the page before it failed", endpoint.url)
+                    handling.failed = True
+                    return
+
+            self._handle_call_response(endpoint.endpoint, result, previous=handling)
+            if has_content:
+                endpoint.endpoint._handle_output(endpoint.endpoint.implementation(result.response))
+        except BaseException:
+            handling.failed = True
+            raise
+        finally:
+            handling.done.set()
+
+    def _request_with_retries(self, call: HttpCall, url: str) -> Response:
+        """
+        Send a request, retrying server errors and rate limits with exponential backoff and full jitter. Client errors
+        are raised immediately, since they will not resolve by themselves.
+        """
+        if self._session is None:
+            raise ValueError("You must run the extractor in a context manager")
 
-            result = endpoint.endpoint.implementation(response)
-            self.handle_output(result)
-        except (JSONDecodeError, DaciteError) as e:
-            self.logger.error(f"Error while parsing response: {str(e)}")
-            raise e
+        retries = self.config.source.retries
+        attempt = 0
+
+        cached = call.endpoint._cached_response
+        validators = cached[1] if cached is not None and cached[0] == url else None
+
+        while True:
+            headers = self.prepare_headers(call.endpoint)
+            if validators:
+                headers.update(validators)
+            resp = self._session.request(
+                method=call.endpoint.method,
+                url=url,
+                data=call.endpoint._serialized_body
+                if call.endpoint._body_is_static
+                else _format_body(call.endpoint.body),
+                headers=headers,
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                status = HTTPStatus(resp.status_code)
+                self.logger.debug(
+                    "Response %d: %s %s - %s", resp.status_code, status.name, status.description, resp.reason
+                )
+
+            attempt += 1
+            if (
+                resp.ok
+                or not _is_retryable(resp.status_code)
+                or attempt == retries.number
+                or self.cancellation_token.is_set()
+            ):
+                resp.raise_for_status()
+                return resp
+
+            retry_after = _get_retry_after(resp)
+            if retry_after is not None:
+                # The server's wish is honoured, but not beyond what the extractor is configured to wait
+                delay = min(retry_after, retries.max_delay)
+            else:
+                delay = random.uniform(
+                    0, min(retries.max_delay, retries.delay * retries.backoff_factor ** (attempt - 1))
+                )
+            self.logger.warning("%d %s from %s, retrying in %.2f seconds...", resp.status_code, resp.reason, url, delay)
+            self.cancellation_token.wait(delay)
 
-        return HttpCallResult(url=endpoint.url, response=response)
+    def _retry_after_interval(self, call: HttpCall) -> None:
+        """
+        Schedule a failed call to a periodic endpoint again after its interval, so that one failed call does not stop
+        the endpoint for the rest of the run.
+        """
+        endpoint = call.endpoint
+        url = call.url if endpoint.next_page is not None else _get_initial_url(self.base_url, endpoint)
+        self.logger.info("Retrying endpoint %s in %d seconds", endpoint.name, endpoint.interval)
+        self._schedule_call(
+            HttpCall(endpoint=endpoint, url=url, call_when=time.time() + (endpoint.interval or 0), previous=None)
+        )
 
-    def _handle_call_response(self, endpoint: Endpoint, call: HttpCallResult) -> None:
+    def _handle_call_response(
+        self, endpoint: Endpoint, call: HttpCallResult, previous: Optional[_PageHandling] = None
+    ) -> None:
         if endpoint.next_page is None:
-            return
-        next_url = endpoint.next_page(call)
+            # Without pagination, periodic endpoints start over from the initial URL
+            next_url = _get_initial_url(self.base_url, endpoint) if endpoint.interval is not None else None
+        else:
+            next_url = endpoint.next_page(call)
+
         if next_url is not None:
-            next = HttpCall(
-                endpoint=endpoint,
-                url=next_url,
-                call_when=0 if endpoint.interval is None else time.time() + endpoint.interval,
+            self._schedule_call(
+                HttpCall(
+                    endpoint=endpoint,
+                    url=next_url,
+                    call_when=0 if endpoint.interval is None else time.time() + endpoint.interval,
+                    previous=previous,
+                )
             )
-            self._call_queue.put(PrioritizedHttpCall(priority=next.call_when, call=next))
 
 
-T = TypeVar("T")
+_PARSE_ERRORS: Tuple[Type[Exception], ...] = (orjson.JSONDecodeError, DaciteError)
+if msgspec is not None:
+    _PARSE_ERRORS += (msgspec.DecodeError,)
+
+
+def _is_retryable(status_code: int) -> bool:
+    return status_code == HTTPStatus.TOO_MANY_REQUESTS or status_code >= 500
 
 
-def _get_or_call(item: Union[T, Callable[[], T]]) -> T:
-    return item() if callable(item) else item
+def _get_retry_after(response: Response) -> Optional[float]:
+    """
+    Get the number of seconds to wait before retrying from the ``Retry-After`` header, if the server gave one.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
 
 
-def _format_body(body: Optional[RequestBodyTemplate]) -> Optional[str]:
+def _get_validators(response: Response) -> Dict[str, str]:
+    """
+    Get the headers for a conditional request revalidating the given response, if the server sent any validators.
+    """
+    validators = {}
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        validators["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified is not None:
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+def _body_has_callable(body: Optional[RequestBodyTemplate]) -> bool:
+    if isinstance(body, dict):
+        return any(_body_has_callable(v) for v in body.values())
+    elif isinstance(body, list):
+        return any(_body_has_callable(i) for i in body)
+    else:
+        return callable(body)
+
+
+def _format_body(body: Optional[RequestBodyTemplate]) -> Optional[bytes]:
     if body is None:
         return None
 
-    def recursive_get_or_call(item: RequestBodyTemplate) -> JsonBody:
-        if isinstance(item, dict):
-            return {k: recursive_get_or_call(v) for k, v in item.items()}
-        elif isinstance(item, list):
-            return [recursive_get_or_call(i) for i in item]
-        else:
-            res = _get_or_call(item)
-            if isinstance(res, (list, dict)):
-                return recursive_get_or_call(res)
-            return res
+    # orjson walks the template natively, and only calls back into Python for values it can't serialize by itself.
+    # Values returned from callables are serialized the same way, so nested callables are resolved too.
+    return orjson.dumps(body, default=_resolve_callable)
 
-    return json.dumps(recursive_get_or_call(body))
+
+def _resolve_callable(item: Any) -> Any:
+    if callable(item):
+        return item()
+    raise TypeError(f"Type is not JSON serializable: {type(item).__name__}")
+
+
+def _get_output_type(implementation: Callable[[ResponseType], CdfTypes]) -> Optional[type]:
+    """
+    Get the type of CDF object an endpoint implementation returns, either directly or as a list, iterator or generator.
+
+    Returns:
+        One of ``Event``, ``RawRow`` or ``InsertDatapoints``, or None if that can't be decided from the annotations.
+    """
+    try:
+        return_type = get_type_hints(implementation).get("return")
+    except Exception:
+        # Unresolvable forward references, callable objects without annotations, etc
+        return None
+
+    if get_origin(return_type) in (list, get_origin(Iterable), get_origin(Iterator), get_origin(Generator)):
+        args = get_args(return_type)
+        return_type = args[0] if args else None
+
+    if return_type in (Event, RawRow, InsertDatapoints):
+        return return_type
+    return None
+
+
+def _get_response_parser(response_type: Type[ResponseType]) -> Callable[[Response], ResponseType]:
+    """
+    Get a function deserializing a raw response into the given response type, so that the choice of deserialization
+    only has to be made once per endpoint.
+    """
+    if response_type == Response:
+        return lambda raw_response: raw_response  # type: ignore
+
+    if response_type == bytes:
+        return lambda raw_response: raw_response.content  # type: ignore
+
+    if response_type == str:
+        return lambda raw_response: raw_response.text  # type: ignore
+
+    if response_type == JsonBody:
+        return lambda raw_response: orjson.loads(raw_response.content)
+
+    if msgspec is not None and isinstance(response_type, type) and issubclass(response_type, msgspec.Struct):
+        # msgspec decodes straight into the struct without an intermediate dict
+        decoder = msgspec.json.Decoder(response_type)
+
+        def parse_struct(raw_response: Response) -> ResponseType:
+            content = raw_response.content
+            if content.lstrip()[:1] == b"[":
+                content = b'{"items":' + content + b"}"
+            return decoder.decode(content)
+
+        return parse_struct
+
+    from_dict = _get_from_dict(response_type) or (lambda data: dacite.from_dict(response_type, data))
+
+    def parse_dataclass(raw_response: Response) -> ResponseType:
+        data = orjson.loads(raw_response.content)
+        if isinstance(data, list):
+            data = {"items": data}
+        return from_dict(data)
+
+    return parse_dataclass
+
+
+def _get_from_dict(response_type: Type[ResponseType]) -> Optional[Callable[[Dict[str, Any]], ResponseType]]:
+    """
+    Get the converter of a type bringing its own, such as mashumaro's ``DataClassDictMixin``, which has it compiled for
+    the type already. Only a ``from_dict`` class method that can be called with the parsed JSON alone counts, anything
+    else by that name is left alone, and the type is converted with dacite instead.
+    """
+    if not isinstance(inspect.getattr_static(response_type, "from_dict", None), classmethod):
+        return None
+
+    from_dict = response_type.from_dict  # type: ignore
+    try:
+        inspect.signature(from_dict).bind({})
+    except (TypeError, ValueError):
+        return None
+    return from_dict
 
 
 def _get_initial_url(base_url: str, endpoint: Endpoint) -> HttpUrl:
+    if endpoint._url is not None:
+        return HttpUrl(endpoint._url)
     return HttpUrl(
         urljoin(
             base_url,
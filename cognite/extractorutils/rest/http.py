@@ -14,12 +14,13 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
-from urllib.parse import urlparse
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
 from uuid import uuid4
 
 import arrow
 from cognite.extractorutils.uploader_types import CdfTypes
+from requests import Response
 
 ResponseType = TypeVar("ResponseType")
 
@@ -36,7 +37,7 @@ RequestBodyTemplate = Union[  # type: ignore
 ]
 
 
-class HttpMethod(Enum):
+class HttpMethod(str, Enum):
     GET = "GET"
     POST = "POST"
 
@@ -52,15 +53,14 @@ class HttpUrl:
         url: a complete string representation of the URL
     """
 
+    __slots__ = ("scheme", "netloc", "path", "query", "fragment")
+
     def __init__(self, url: str):
         parse_res = urlparse(url)
         self.scheme = parse_res.scheme
         self.netloc = parse_res.netloc
         self.path = parse_res.path
-        if parse_res.query:
-            self.query = {k: v for k, v in [i.split("=") for i in parse_res.query.split("&")]}
-        else:
-            self.query = {}
+        self.query: Dict[str, Any] = dict(parse_qsl(parse_res.query, keep_blank_values=True))
         self.fragment = parse_res.fragment
 
     def add_to_query(self, query: Optional[Dict[str, Any]]) -> None:
@@ -72,7 +72,7 @@ class HttpUrl:
         """
         Get a string representation of the URL, ready to be passed to the ``requests`` library.
         """
-        query = f"?{'&'.join([f'{k}={v}' for k, v in self.query.items()])}" if self.query else ""
+        query = f"?{urlencode(self.query)}" if self.query else ""
         fragment = f"#{self.fragment}" if self.fragment else ""
         return f"{self.scheme}://{self.netloc}{self.path}{query}{fragment}"
 
@@ -89,6 +89,8 @@ class HttpCallResult(Generic[ResponseType]):
     for the request.
     """
 
+    __slots__ = ("uuid", "url", "response", "time")
+
     def __init__(self, url: HttpUrl, response: ResponseType):
         self.uuid = uuid4()
         self.url = url
@@ -98,13 +100,54 @@ class HttpCallResult(Generic[ResponseType]):
 
 @dataclass
 class Endpoint(Generic[ResponseType]):
+    __slots__ = (
+        "name",
+        "implementation",
+        "method",
+        "path",
+        "query",
+        "headers",
+        "body",
+        "response_type",
+        "next_page",
+        "interval",
+        "prefetch",
+        "_url",
+        "_static_headers",
+        "_dynamic_headers",
+        "_static_query",
+        "_dynamic_query",
+        "_parse_response",
+        "_handle_output",
+        "_body_is_static",
+        "_serialized_body",
+        "_revalidate",
+        "_cached_response",
+    )
+
     name: Optional[str]
     implementation: Callable[[ResponseType], CdfTypes]
     method: HttpMethod
     path: Union[str, Callable[[], str]]
     query: Dict[str, Any]
     headers: Dict[str, Union[str, Callable[[], str]]]
-    body: Optional[JsonBody]
+    body: Optional[RequestBodyTemplate]
     response_type: Type[ResponseType]
     next_page: Optional[Callable[[HttpCallResult], Optional[HttpUrl]]]
     interval: Optional[int]
+    prefetch: bool
+
+    def __post_init__(self) -> None:
+        # Precomputed by the extractor when the endpoint is scheduled
+        self._url: Optional[str] = None
+        self._static_headers: Dict[str, str] = {}
+        self._dynamic_headers: Dict[str, Callable[[], str]] = {}
+        self._static_query: Dict[str, str] = {}
+        self._dynamic_query: Dict[str, Callable[[], Any]] = {}
+        self._parse_response: Callable[[Response], ResponseType]
+        self._handle_output: Callable[[Any], None]
+        self._body_is_static = False
+        self._serialized_body: Optional[bytes] = None
+        # URL, conditional request headers and parsed response of the last call to an endpoint polling the same URL
+        self._revalidate = False
+        self._cached_response: Optional[Tuple[str, Dict[str, str], Any]] = None
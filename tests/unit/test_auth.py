@@ -43,3 +43,33 @@ class TestAuthenticationProvider(unittest.TestCase):
         auth.authenticator._request = MagicMock(return_value={"expires_in": 1000, "access_token": "tokey"})
         self.assertEqual(auth.auth_header, "Bearer tokey")
         auth.authenticator._request.assert_called()
+
+    def test_oauth_cached(self) -> None:
+        auth = AuthenticationProvider(AuthConfig(basic=None, oauth=oauth_config))
+
+        self.assertIsNotNone(auth.authenticator)
+        auth.authenticator.get_token = MagicMock(return_value="tokey")
+        auth.authenticator._response = {"expires_in": 1000, "access_token": "tokey"}
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        auth.authenticator.get_token.assert_called_once()
+
+    def test_oauth_expired(self) -> None:
+        auth = AuthenticationProvider(AuthConfig(basic=None, oauth=oauth_config))
+
+        self.assertIsNotNone(auth.authenticator)
+        auth.authenticator.get_token = MagicMock(return_value="tokey")
+        auth.authenticator._response = {"expires_in": 0, "access_token": "tokey"}
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        self.assertEqual(auth.authenticator.get_token.call_count, 2)
+
+    def test_oauth_no_token_lifetime(self) -> None:
+        auth = AuthenticationProvider(AuthConfig(basic=None, oauth=oauth_config))
+
+        self.assertIsNotNone(auth.authenticator)
+        auth.authenticator.get_token = MagicMock(return_value="tokey")
+        del auth.authenticator._response
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        self.assertEqual(auth.auth_header, "Bearer tokey")
+        self.assertEqual(auth.authenticator.get_token.call_count, 2)
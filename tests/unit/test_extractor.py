@@ -12,9 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
 import unittest
+from email.utils import formatdate
+from typing import Generator, Iterable, List, Optional
 
-from cognite.extractorutils.rest.extractor import _format_body, _get_or_call
+from cognite.extractorutils.uploader_types import CdfTypes, Event, InsertDatapoints, RawRow
+from requests import Response
+
+from cognite.extractorutils.rest.extractor import _body_has_callable, _format_body, _get_output_type, _get_retry_after
 
 
 class Iterator:
@@ -32,46 +38,102 @@ class TestFormatBody(unittest.TestCase):
 
     def test_dict_values(self) -> None:
         self.assertEqual(
-            _format_body({"key1": "val", "key2": 42, "key3": None}), '{"key1": "val", "key2": 42, "key3": null}'
+            _format_body({"key1": "val", "key2": 42, "key3": None}), b'{"key1":"val","key2":42,"key3":null}'
         )
 
     def test_recursive_dict_values(self) -> None:
         self.assertEqual(
             _format_body({"key1": "val", "key2": {"subkey": "subval"}, "key3": ["item1", "item2", "item3"]}),
-            '{"key1": "val", "key2": {"subkey": "subval"}, "key3": ["item1", "item2", "item3"]}',
+            b'{"key1":"val","key2":{"subkey":"subval"},"key3":["item1","item2","item3"]}',
         )
 
     def test_callable(self) -> None:
-        self.assertEqual(_format_body({"key1": lambda: "val"}), '{"key1": "val"}')
+        self.assertEqual(_format_body({"key1": lambda: "val"}), b'{"key1":"val"}')
 
     def test_recursive_callable(self) -> None:
-        self.assertEqual(_format_body({"key1": lambda: {"subkey": lambda: "subval"}}), '{"key1": {"subkey": "subval"}}')
+        self.assertEqual(_format_body({"key1": lambda: {"subkey": lambda: "subval"}}), b'{"key1":{"subkey":"subval"}}')
 
     def test_callable_in_list(self) -> None:
-        self.assertEqual(_format_body({"key": lambda: ["item1", lambda: "item2"]}), '{"key": ["item1", "item2"]}')
+        self.assertEqual(_format_body({"key": lambda: ["item1", lambda: "item2"]}), b'{"key":["item1","item2"]}')
 
     def test_empty_object(self) -> None:
-        self.assertEqual(_format_body({}), "{}")
-        self.assertEqual(_format_body(lambda: {}), "{}")
+        self.assertEqual(_format_body({}), b"{}")
+        self.assertEqual(_format_body(lambda: {}), b"{}")
 
     def test_callable_class(self) -> None:
         it = Iterator()
-        self.assertEqual(_format_body({"key": lambda: [it, it, it, it]}), '{"key": [1, 2, 3, 4]}')
-        self.assertEqual(_format_body({"key": lambda: [it, it, it, it]}), '{"key": [5, 6, 7, 8]}')
+        self.assertEqual(_format_body({"key": lambda: [it, it, it, it]}), b'{"key":[1,2,3,4]}')
+        self.assertEqual(_format_body({"key": lambda: [it, it, it, it]}), b'{"key":[5,6,7,8]}')
 
+    def test_unserializable(self) -> None:
+        with self.assertRaises(TypeError):
+            _format_body({"key": object()})
 
-class TestGetOrCall(unittest.TestCase):
-    def test_none(self) -> None:
-        self.assertIsNone(_get_or_call(None))
 
-    def test_value(self) -> None:
-        self.assertEqual(_get_or_call(42), 42)
-        self.assertEqual(_get_or_call("hey"), "hey")
+class TestBodyHasCallable(unittest.TestCase):
+    def test_static(self) -> None:
+        self.assertFalse(_body_has_callable(None))
+        self.assertFalse(_body_has_callable({}))
+        self.assertFalse(_body_has_callable({"filter": {}, "limit": 1000}))
+        self.assertFalse(_body_has_callable({"key": ["item1", {"subkey": None}]}))
 
     def test_callable(self) -> None:
-        self.assertEqual(_get_or_call(lambda: 42), 42)
-        self.assertEqual(_get_or_call(lambda: 1 + 2 + 3), 6)
-        self.assertEqual(_get_or_call(lambda: "hey"), "hey")
+        self.assertTrue(_body_has_callable(lambda: {}))
+        self.assertTrue(_body_has_callable({"key1": lambda: "val"}))
+        self.assertTrue(_body_has_callable({"key1": {"subkey": Iterator()}}))
+        self.assertTrue(_body_has_callable({"key": ["item1", lambda: "item2"]}))
+
+
+class TestGetRetryAfter(unittest.TestCase):
+    def _response(self, retry_after: Optional[str]) -> Response:
+        response = Response()
+        if retry_after is not None:
+            response.headers["Retry-After"] = retry_after
+        return response
+
+    def test_missing(self) -> None:
+        self.assertIsNone(_get_retry_after(self._response(None)))
+
+    def test_seconds(self) -> None:
+        self.assertEqual(_get_retry_after(self._response("120")), 120)
+        self.assertEqual(_get_retry_after(self._response("-1")), 0)
+
+    def test_date(self) -> None:
+        self.assertEqual(_get_retry_after(self._response("Wed, 21 Oct 2015 07:28:00 GMT")), 0)
+        self.assertGreater(_get_retry_after(self._response(formatdate(time.time() + 60, usegmt=True))) or 0, 30)
+
+    def test_invalid(self) -> None:
+        self.assertIsNone(_get_retry_after(self._response("soon")))
+
+
+class TestGetOutputType(unittest.TestCase):
+    def test_single(self) -> None:
+        def handler(data: dict) -> InsertDatapoints:
+            ...
+
+        self.assertIs(_get_output_type(handler), InsertDatapoints)
+
+    def test_collections(self) -> None:
+        def generator(data: dict) -> Generator[Event, None, None]:
+            ...
+
+        def iterable(data: dict) -> Iterable[RawRow]:
+            ...
+
+        def list_handler(data: dict) -> List[RawRow]:
+            ...
+
+        self.assertIs(_get_output_type(generator), Event)
+        self.assertIs(_get_output_type(iterable), RawRow)
+        self.assertIs(_get_output_type(list_handler), RawRow)
+
+    def test_unknown(self) -> None:
+        def union(data: dict) -> CdfTypes:
+            ...
+
+        self.assertIsNone(_get_output_type(union))
+        self.assertIsNone(_get_output_type(lambda data: []))
+        self.assertIsNone(_get_output_type(Iterator()))
 
 
 if __name__ == "__main__":
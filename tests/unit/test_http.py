@@ -0,0 +1,40 @@
+#  Copyright 2022 Cognite AS
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from cognite.extractorutils.rest.http import HttpUrl
+
+
+class TestHttpUrl(unittest.TestCase):
+    def test_no_query(self) -> None:
+        url = HttpUrl("https://example.com/path")
+        self.assertEqual(url.query, {})
+        self.assertEqual(str(url), "https://example.com/path")
+
+    def test_query(self) -> None:
+        url = HttpUrl("https://example.com/path?a=1&b=two#fragment")
+        self.assertEqual(url.query, {"a": "1", "b": "two"})
+        self.assertEqual(url.fragment, "fragment")
+        self.assertEqual(str(url), "https://example.com/path?a=1&b=two#fragment")
+
+    def test_blank_and_encoded_values(self) -> None:
+        url = HttpUrl("https://example.com/path?empty=&cursor=a%3Db%26c")
+        self.assertEqual(url.query, {"empty": "", "cursor": "a=b&c"})
+        self.assertEqual(str(url), "https://example.com/path?empty=&cursor=a%3Db%26c")
+
+    def test_add_to_query(self) -> None:
+        url = HttpUrl("https://example.com/path?a=1")
+        url.add_to_query({"a": 2, "cursor": "x/y z"})
+        self.assertEqual(str(url), "https://example.com/path?a=2&cursor=x%2Fy+z")
@@ -1,9 +1,14 @@
+import gzip
+import json
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Generator, List, Optional
 
+import pytest
 import requests
 from cognite.client.data_classes import Row
-from cognite.extractorutils.uploader_types import RawRow
+from cognite.extractorutils.uploader_types import Event, RawRow
 from requests_mock import Mocker
 
 from cognite.extractorutils.rest import RestExtractor
@@ -21,13 +26,13 @@ class ResponseTypeList:
     items: List[MyResponseType]
 
 
-def get_extractor(idx: int) -> RestExtractor:
+def get_extractor(idx: int, config_file_path: str = "tests/unit/test_config.yml") -> RestExtractor:
     extractor = RestExtractor(
         name=f"Test extractor {idx}",
         description="test",
         version="1.0.0",
         default_base_url="http://mybaseurl.foo/",
-        config_file_path="tests/unit/test_config.yml",
+        config_file_path=config_file_path,
     )
     extractor.cancellation_token.clear()
     extractor._min_check_interval = 0.1
@@ -196,3 +201,428 @@ class TestRequests:
 
         with extractor:
             extractor.run()
+
+    def test_headers(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        RawMocker(requests_mock)
+        extractor = get_extractor(7)
+        extractor.headers = {"global": "global", "overridden": "global", "dynamic": lambda: "dynamic"}
+
+        @extractor.get(
+            "path",
+            response_type=MyResponseType,
+            headers={"overridden": "endpoint", "endpoint-dynamic": lambda: "endpoint"},
+        )
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        headers = call.last_request.headers
+        assert headers["global"] == "global"
+        assert headers["overridden"] == "endpoint"
+        assert headers["dynamic"] == "dynamic"
+        assert headers["endpoint-dynamic"] == "endpoint"
+        assert "Content-Type" not in headers
+
+    def test_auth_header(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        RawMocker(requests_mock)
+        extractor = get_extractor(8, "tests/unit/test_config_auth.yml")
+
+        @extractor.get("path", response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.last_request.headers["Authorization"] == "Basic dXNlcjpwYXNz"
+        assert "Authentication" not in call.last_request.headers
+
+    def test_events(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json=[{"it": 1, "cursor": None}, {"it": 2, "cursor": None}])
+        events = requests_mock.post(
+            url="https://api.cognitedata.com/api/v1/projects/test/events", json={"items": [{"externalId": "event"}]}
+        )
+        extractor = get_extractor(9)
+
+        @extractor.get("path", response_type=ResponseTypeList)
+        def get_test_resp(data: ResponseTypeList) -> Generator[Event, None, None]:
+            for item in data.items:
+                yield Event(external_id=f"event-{item.it}")
+
+        with extractor:
+            extractor.run()
+
+        assert events.call_count == 1
+        assert len(json.loads(gzip.decompress(events.last_request.body))["items"]) == 2
+
+    def test_interval(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        RawMocker(requests_mock)
+        extractor = get_extractor(10)
+
+        @extractor.get("path", response_type=MyResponseType, interval=1)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            if call.call_count == 2:
+                extractor.cancellation_token.set()
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.call_count == 2
+
+    def test_query(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        RawMocker(requests_mock)
+        extractor = get_extractor(11)
+
+        @extractor.get("path", query={"static": 1, "dynamic": lambda: "called"}, response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.call_count == 1
+        assert call.last_request.qs == {"static": ["1"], "dynamic": ["called"]}
+
+    def test_retry_server_error(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(
+            url="http://mybaseurl.foo/path",
+            response_list=[{"status_code": 503}, {"status_code": 429}, {"json": {"it": 1, "cursor": None}}],
+        )
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(12, config_file_path="tests/unit/test_config_retries.yml")
+
+        @extractor.get("path", response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.call_count == 3
+        assert raw.calls == 1
+
+    def test_no_retry_client_error(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", status_code=404)
+        extractor = get_extractor(13, config_file_path="tests/unit/test_config_retries.yml")
+
+        @extractor.get("path", response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            with pytest.raises(RuntimeError):
+                extractor.run()
+
+        assert call.call_count == 1
+
+    def test_retries_exhausted(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(url="http://mybaseurl.foo/path", status_code=500, headers={"Retry-After": "0"})
+        extractor = get_extractor(14, config_file_path="tests/unit/test_config_retries.yml")
+
+        @extractor.get("path", response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            with pytest.raises(RuntimeError):
+                extractor.run()
+
+        assert call.call_count == 3
+
+    def test_retry_after_capped(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(
+            url="http://mybaseurl.foo/path",
+            response_list=[
+                {"status_code": 503, "headers": {"Retry-After": "86400"}},
+                {"json": {"it": 1, "cursor": None}},
+            ],
+        )
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(24, config_file_path="tests/unit/test_config_retries.yml")
+
+        @extractor.get("path", response_type=MyResponseType)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        # Stop the extractor instead of hanging if the delay is not capped by max-delay
+        watchdog = threading.Timer(10, extractor.cancellation_token.set)
+        watchdog.start()
+        start = time.monotonic()
+        with extractor:
+            extractor.run()
+        watchdog.cancel()
+
+        assert time.monotonic() - start < 5
+        assert call.call_count == 2
+        assert raw.calls == 1
+
+    def test_msgspec_struct(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json=[{"it": 1, "cursor": None}, {"it": 2, "cursor": None}])
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(15)
+        msgspec = pytest.importorskip("msgspec")
+
+        class MyStruct(msgspec.Struct):
+            it: int
+            cursor: Optional[str]
+
+        class MyStructList(msgspec.Struct):
+            items: List[MyStruct]
+
+        @extractor.get("path", response_type=MyStructList)
+        def get_test_resp(data: MyStructList) -> Generator[RawRow, None, None]:
+            assert isinstance(data, MyStructList)
+            for item in data.items:
+                yield RawRow("mydb", "mytable", Row(key=item.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert raw.calls == 1
+
+    def test_from_dict(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(16)
+
+        @dataclass
+        class OwnConverter:
+            it: int
+
+            @classmethod
+            def from_dict(cls, data: dict) -> "OwnConverter":
+                return cls(it=data["it"] + 1)
+
+        @extractor.get("path", response_type=OwnConverter)
+        def get_test_resp(data: OwnConverter) -> Generator[RawRow, None, None]:
+            assert data.it == 2
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert raw.calls == 1
+
+    def test_unrelated_from_dict(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": None})
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(26)
+
+        @dataclass
+        class InstanceMethod:
+            it: int
+
+            def from_dict(self, data: dict) -> None:
+                raise AssertionError("Not a converter")
+
+        @dataclass
+        class OtherSignature:
+            it: int
+
+            @classmethod
+            def from_dict(cls, data: dict, *, strict: bool) -> "OtherSignature":
+                raise AssertionError("Not a converter")
+
+        @extractor.get("path", response_type=InstanceMethod)
+        def get_test_resp(data: InstanceMethod) -> Generator[RawRow, None, None]:
+            assert data.it == 1
+            yield RawRow("mydb", "mytable", Row(key="instance", columns={"test": "test"}))
+
+        @extractor.get("path", response_type=OtherSignature)
+        def get_test_resp_other(data: OtherSignature) -> Generator[RawRow, None, None]:
+            assert data.it == 1
+            yield RawRow("mydb", "mytable", Row(key="other", columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert raw.calls == 1
+
+    def test_text_response(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", text="a,b\n1,2\n")
+        raw = RawMocker(requests_mock)
+        extractor = get_extractor(17)
+
+        @extractor.get("path", response_type=str)
+        def get_test_resp(data: str) -> Generator[RawRow, None, None]:
+            assert data == "a,b\n1,2\n"
+            yield RawRow("mydb", "mytable", Row(key="text", columns={"test": "test"}))
+
+        @extractor.get("path", response_type=bytes)
+        def get_test_resp_bytes(data: bytes) -> Generator[RawRow, None, None]:
+            assert data == b"a,b\n1,2\n"
+            yield RawRow("mydb", "mytable", Row(key="bytes", columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert raw.calls == 1
+
+    def test_interval_not_modified(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(
+            url="http://mybaseurl.foo/path",
+            response_list=[
+                {"json": {"it": 1, "cursor": None}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+                {"json": {"it": 2, "cursor": None}, "headers": {"ETag": '"v2"'}},
+            ],
+        )
+        RawMocker(requests_mock)
+        extractor = get_extractor(18)
+        extractor._min_check_interval = 0.01
+        handled: List[int] = []
+
+        @extractor.get("path", response_type=MyResponseType, interval=0)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            handled.append(data.it)
+            if data.it == 2:
+                extractor.cancellation_token.set()
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.call_count == 3
+        assert handled == [1, 2]
+        assert "If-None-Match" not in call.request_history[0].headers
+        assert call.request_history[1].headers["If-None-Match"] == '"v1"'
+        assert call.request_history[2].headers["If-None-Match"] == '"v1"'
+
+    def test_next_page_prefetched(self, requests_mock: Mocker) -> None:
+        second_requested = threading.Event()
+
+        def second_page(request: requests.Request, context: Any) -> dict:
+            second_requested.set()
+            return {"it": 2, "cursor": None}
+
+        requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": "next"})
+        requests_mock.get(url="http://mybaseurl.foo/path?cursor=next", json=second_page)
+        RawMocker(requests_mock)
+        extractor = get_extractor(19)
+        handled: List[int] = []
+
+        def next_page(call: HttpCallResult) -> Optional[HttpUrl]:
+            if call.response.cursor is not None:
+                call.url.query["cursor"] = call.response.cursor
+                return call.url
+            return None
+
+        @extractor.get("path", response_type=MyResponseType, next_page=next_page, prefetch=True)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            if data.it == 1:
+                # The second page is requested while the first one is still being handled
+                assert second_requested.wait(5)
+            handled.append(data.it)
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert handled == [1, 2]
+
+    def test_next_page_after_handling(self, requests_mock: Mocker) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": "next"})
+        requests_mock.get(url="http://mybaseurl.foo/path?cursor=next", json={"it": 2, "cursor": None})
+        RawMocker(requests_mock)
+        extractor = get_extractor(20)
+        handled: List[int] = []
+        cursor: Optional[str] = None
+
+        def next_page(call: HttpCallResult) -> Optional[HttpUrl]:
+            # Relies on state set while handling the page
+            if cursor is not None:
+                call.url.query["cursor"] = cursor
+                return call.url
+            return None
+
+        @extractor.get("path", response_type=MyResponseType, next_page=next_page)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            nonlocal cursor
+            cursor = data.cursor
+            handled.append(data.it)
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert handled == [1, 2]
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_failed_page_stops_pagination(self, requests_mock: Mocker, prefetch: bool) -> None:
+        requests_mock.get(url="http://mybaseurl.foo/path", json={"it": 1, "cursor": "next"})
+        requests_mock.get(url="http://mybaseurl.foo/path?cursor=next", json={"it": 2, "cursor": "last"})
+        requests_mock.get(url="http://mybaseurl.foo/path?cursor=last", json={"it": 3, "cursor": None})
+        extractor = get_extractor(22 if prefetch else 21)
+        handled: List[int] = []
+
+        def next_page(call: HttpCallResult) -> Optional[HttpUrl]:
+            if call.response.cursor is not None:
+                call.url.query["cursor"] = call.response.cursor
+                return call.url
+            return None
+
+        @extractor.get("path", response_type=MyResponseType, next_page=next_page, prefetch=prefetch)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            handled.append(data.it)
+            raise ValueError("Failed to handle page")
+            yield
+
+        with extractor:
+            with pytest.raises(RuntimeError):
+                extractor.run()
+
+        assert handled == [1]
+
+    def test_interval_continues_after_failure(self, requests_mock: Mocker) -> None:
+        call = requests_mock.get(
+            url="http://mybaseurl.foo/path",
+            response_list=[{"status_code": 404}, {"json": {"it": 1, "cursor": None}}],
+        )
+        RawMocker(requests_mock)
+        extractor = get_extractor(23)
+        extractor._min_check_interval = 0.01
+        handled: List[int] = []
+
+        @extractor.get("path", response_type=MyResponseType, interval=0)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            handled.append(data.it)
+            extractor.cancellation_token.set()
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            extractor.run()
+
+        assert call.call_count == 2
+        assert handled == [1]
+
+    def test_interval_last_call_failed(self, requests_mock: Mocker) -> None:
+        def mock_response(request: requests.Request, context: Any) -> dict:
+            if call.call_count == 2:
+                context.status_code = 404
+                extractor.cancellation_token.set()
+            return {"it": call.call_count, "cursor": None}
+
+        call = requests_mock.get(url="http://mybaseurl.foo/path", json=mock_response)
+        RawMocker(requests_mock)
+        extractor = get_extractor(25)
+        extractor._min_check_interval = 0.01
+        handled: List[int] = []
+
+        @extractor.get("path", response_type=MyResponseType, interval=0)
+        def get_test_resp(data: MyResponseType) -> Generator[RawRow, None, None]:
+            handled.append(data.it)
+            yield RawRow("mydb", "mytable", Row(key=data.it, columns={"test": "test"}))
+
+        with extractor:
+            with pytest.raises(RuntimeError):
+                extractor.run()
+
+        assert call.call_count == 2
+        assert handled == [1]